@@ -1,21 +1,145 @@
 # data_processing.py
 
+from __future__ import annotations
+
+import csv
+import io
 import os
-import pandas as pd
-import datetime
+import re
 import shutil
-import docx
-from docx.shared import Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+import datetime
 import requests
-from bs4 import BeautifulSoup
 import json
-from typing import List
-from jinja2 import Environment, FileSystemLoader
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, FrozenSet, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+
+# pandas and docx are slow to import - they are imported lazily
+# in the functions that use them
+if TYPE_CHECKING:
+    import docx
+    import pandas as pd
+
+# Shared HTTP session - keeps connections to justjoin.it alive between calls
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+SESSION.headers.update({"Accept-Encoding": "gzip, deflate"})
+
+# Next.js page payload embedded in every justjoin.it offer page
+NEXT_DATA_PATTERN = re.compile(
+    rb'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.S
+)
+
+# Character style shared by the CV and cover letter footers
+FOOTER_NOTE_STYLE = "Footer Note"
+
+# Formatting of the tagged PROJECTS.docx paragraphs:
+# tag -> (style, bold, first line indent in points, justified)
+PROJECT_TAG_PATTERN = re.compile(
+    r"^<(main-info|company|project|project-desc|project-skills)>\s*"
+)
+PROJECT_TAG_FORMATS = {
+    # Main section - "MAIN PROJECTS"
+    "main-info": ("Heading 1", False, None, False),
+    # Company name - bolded
+    "company": (None, True, None, True),
+    # Project - tabulation + bold
+    "project": (None, True, 0, True),
+    # Project description - double tabulation
+    "project-desc": (None, False, 0, True),
+    # Skills - double tabulation
+    "project-skills": (None, False, 36, True),
+}
+PROJECT_OTHER_FORMAT = (None, False, None, True)
+
+# Character substitutions used to build directory and file names
+TIMESTAMP_FORMAT = "%Y_%m_%d_%H_%M_%S"
+DIR_NAME_TABLE = str.maketrans(
+    {" ": "_", "-": "_", ":": "_", "(": "_", ")": "_"}
+)
+FILENAME_TABLE = str.maketrans({
+    " ": "_", "-": "_", "/": "_", "\\": "_", "(": "_", ")": "_",
+    "*": None, "|": None, ":": None, "?": None, "<": None, ">": None,
+})
+
+# Documents already generated for a (working dir, position, skills) key,
+# offers asking for the same CV get copies instead of a rebuild. Cleared
+# by every request, so edited source documents are picked up
+CV_CACHE = {}
+
+# Columns taken from the job listing for every offer
+OFFER_COLUMNS = (
+    "TITLE", "REQUIRED_SKILLS", "ADDITIONAL_SKILLS", "WORKPLACE_TYPE",
+    "REMOTE_INTERVIEW", "URL", "PAYMENT_FROM", "PAYMENT_TO", "LOCATION",
+    "COMPANY", "DATE", "JOB_TYPE",
+)
+# Columns of the output_data.csv and output_whole.csv files
+CSV_COLUMNS = OFFER_COLUMNS + ("MATCH_PERCENTAGE",)
+# Types of the CSV columns, given to read_csv so it does not have to
+# infer them - DATE is converted by the analysis itself
+CSV_DTYPES = {
+    "TITLE": str, "REQUIRED_SKILLS": str, "ADDITIONAL_SKILLS": str,
+    "WORKPLACE_TYPE": str, "REMOTE_INTERVIEW": str, "URL": str,
+    "PAYMENT_FROM": "float64", "PAYMENT_TO": "float64", "LOCATION": str,
+    "COMPANY": str, "DATE": str, "JOB_TYPE": str,
+    "MATCH_PERCENTAGE": "float64",
+}
+
+
+def find_key(obj, key: str):
+    """
+    Find the first value stored under the given key in nested JSON data.
+
+    Parameters
+    ----------
+    obj: Parsed JSON data (dicts and lists).
+    key: Key to look for.
 
+    Returns
+    -------
+    Value stored under the key or None if the key is not present.
+    """
+    if isinstance(obj, dict):
+        if key in obj:
+            return obj[key]
+        values = obj.values()
+    elif isinstance(obj, list):
+        values = obj
+    else:
+        return None
+    for value in values:
+        found = find_key(value, key)
+        if found is not None:
+            return found
+    return None
+
+
+def extract_pages(content: bytes) -> list:
+    """
+    Extract the job listing pages from a justjoin.it listing page.
+
+    Parameters
+    ----------
+    content: Raw body of the listing page.
 
-def create_working_dir(working_dir: str, name: str) -> str:
+    Returns
+    -------
+    List of listing pages, each holding the offers under the "data" key.
+    """
+    match = NEXT_DATA_PATTERN.search(content)
+    if not match:
+        raise ValueError("__NEXT_DATA__ payload not found")
+    pages = find_key(json.loads(match.group(1)), "pages")
+    if pages is None:
+        raise ValueError("Job listing pages not found in __NEXT_DATA__")
+    return pages
+
+
+def create_working_dir(
+    working_dir: str, name: str, timestamp: str = None
+) -> str:
     """
     Create a working directory with a timestamp and sanitized name.
 
@@ -23,27 +147,18 @@ def create_working_dir(working_dir: str, name: str) -> str:
     ----------
     working_dir: Base directory where the new directory will be created.
     name: Name to be sanitized and included in the directory name.
+    timestamp: Prefix of the directory name, defaults to the current time.
 
     Returns
     -------
     Path to the newly created directory.
     """
-    date = (
-        str(datetime.datetime.now())
-        .split(".")[0]
-        .replace(" ", "_")
-        .replace("-", "_")
-        .replace(":", "_")
-    )
-    name = (
-        name.replace("-", "_")
-        .replace(":", "_")
-        .replace("(", "_")
-        .replace(")", "_")
+    timestamp = timestamp or datetime.datetime.now().strftime(
+        TIMESTAMP_FORMAT
     )
-    dir_name = os.path.join(working_dir, f"{date}_{name}")
-    if not os.path.exists(dir_name):
-        os.mkdir(dir_name)
+    name = name.translate(DIR_NAME_TABLE)
+    dir_name = os.path.join(working_dir, f"{timestamp}_{name}")
+    os.makedirs(dir_name, exist_ok=True)
     return dir_name
 
 
@@ -59,27 +174,117 @@ def sanitize_filename(filename: str) -> str:
     -------
     Sanitized filename.
     """
-    return (
-        filename.replace(" ", "_")
-        .replace("-", "_")
-        .replace("/", "_")
-        .replace("\\", "_")
-        .replace("*", "")
-        .replace("|", "")
-        .replace(":", "")
-        .replace("?", "")
-        .replace("<", "")
-        .replace(">", "")
-        .replace(":", "_")
-        .replace("(", "_")
-        .replace(")", "_")
+    return filename.translate(FILENAME_TABLE)
+
+
+def footer_note_style(doc: docx.document.Document):
+    """
+    Return the character style used for the footer notes of a document.
+
+    Parameters
+    ----------
+    doc: Document the style belongs to, the style is added on first use.
+
+    Returns
+    -------
+    Character style with 8 pt bold Times New Roman font.
+    """
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.shared import Pt
+
+    try:
+        return doc.styles[FOOTER_NOTE_STYLE]
+    except KeyError:
+        style = doc.styles.add_style(
+            FOOTER_NOTE_STYLE, WD_STYLE_TYPE.CHARACTER
+        )
+        style.font.name = "Times New Roman"
+        style.font.bold = True
+        style.font.size = Pt(8)
+        return style
+
+
+def clear_document_caches() -> None:
+    """
+    Forget the source files and CVs cached by the previous request.
+
+    The app runs for a long time, so the caches only live for one request
+    and the edits made to PT.docx, PROJECTS.docx, github.txt or certs.txt
+    in between are used by the next one.
+
+    This function takes no parameters.
+
+    Returns
+    -------
+    None
+    """
+    read_file_bytes.cache_clear()
+    read_lines.cache_clear()
+    read_docx_paragraphs.cache_clear()
+    CV_CACHE.clear()
+
+
+@lru_cache(maxsize=None)
+def read_file_bytes(file_path: str) -> bytes:
+    """
+    Read a binary file once and keep its content for later calls.
+
+    Parameters
+    ----------
+    file_path: Path to the file to read.
+
+    Returns
+    -------
+    Content of the file.
+    """
+    with open(file_path, "rb") as file:
+        return file.read()
+
+
+@lru_cache(maxsize=None)
+def read_lines(file_path: str) -> Tuple[str, ...]:
+    """
+    Read stripped lines of a text file once and keep them for later calls.
+
+    Parameters
+    ----------
+    file_path: Path to the text file to read.
+
+    Returns
+    -------
+    Stripped lines of the file, empty if the file does not exist.
+    """
+    path = Path(file_path)
+    if not path.exists():
+        return ()
+    return tuple(
+        line.strip() for line in path.read_text(encoding="utf-8").splitlines()
     )
 
 
+@lru_cache(maxsize=None)
+def read_docx_paragraphs(file_path: str) -> Tuple[str, ...]:
+    """
+    Parse a Word document once and keep its stripped paragraph texts.
+
+    Parameters
+    ----------
+    file_path: Path to the .docx file to read.
+
+    Returns
+    -------
+    Stripped text of every paragraph in the document.
+    """
+    import docx
+
+    document = docx.Document(io.BytesIO(read_file_bytes(file_path)))
+    return tuple(para.text.strip() for para in document.paragraphs)
+
+
 def word_cv_prepare(
     working_dir: str, save_dir: str, skills: List[str], position: str,
     current_skills: List[str]
-) -> None:
+) -> List[str]:
     """
     Prepare and save a CV document in a specified directory.
 
@@ -93,31 +298,48 @@ def word_cv_prepare(
 
     Returns
     -------
-    None
+    Messages about the documents that could not be prepared.
     """
+    import docx
+    from docx.enum.text import (
+        WD_ALIGN_PARAGRAPH, WD_BREAK, WD_PARAGRAPH_ALIGNMENT
+    )
+    from docx.shared import Pt
+
     all_skills = sorted(set(current_skills + skills), key=str.lower)
 
     source = os.path.join(working_dir, "PT.docx")
     if not os.path.exists(source):
-        print(f"Source CV file not found: {source}")
-        return
+        return [f"Source CV file not found: {source}"]
+
+    cache_key = (working_dir, position, tuple(all_skills))
+    if cache_key in CV_CACHE:
+        try:
+            for file_path in CV_CACHE[cache_key]:
+                shutil.copy(file_path, save_dir)
+            return []
+        except OSError:
+            pass  # The earlier documents are gone - generate them again
 
     destination = os.path.join(save_dir, "PrzemyslawTuturCV.docx")
     try:
-        shutil.copy(source, destination)
+        template = read_file_bytes(source)
+        with open(destination, "wb") as file:
+            file.write(template)
     except OSError as e:
-        print(f"Error copying document: {e}")
-        return
+        return [f"Error copying document: {e}"]
 
     doc_name_position = sanitize_filename(position)
     try:
-        doc = docx.Document(destination)
+        doc = docx.Document(io.BytesIO(template))
     except Exception as e:
-        print(f"Error opening document: {e}")
-        return
+        return [f"Error opening document: {e}"]
+
+    # Trailing sentinel - new paragraphs are inserted before it
+    sentinel = doc.add_paragraph()
 
     # Add all skills
-    paragraph = doc.add_paragraph(", ".join(all_skills).upper())
+    paragraph = sentinel.insert_paragraph_before(", ".join(all_skills).upper())
     paragraph.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
     run = paragraph.runs[0]
     run.font.name = "Times New Roman"
@@ -133,38 +355,32 @@ def word_cv_prepare(
         f"Monty Python 'spam, spam, spam' scenario if you have received "
         f"multiple CVs."
     )
-    footer_para_run.font.name = "Times New Roman"
-    footer_para_run.font.bold = True
-    footer_para_run.font.size = Pt(8)
+    footer_para_run.style = footer_note_style(doc)
 
     # Read certification and GitHub files
     certs_file = os.path.join(working_dir, "certs.txt")
     github_file = os.path.join(working_dir, "github.txt")
 
-    certs_links = []
-    github_links = []
-
-    if os.path.exists(certs_file):
-        with open(certs_file, "r") as file:
-            certs_links = [line.strip() for line in file]
-
-    if os.path.exists(github_file):
-        with open(github_file, "r") as file:
-            github_links = [line.strip() for line in file]
+    certs_links = read_lines(certs_file)
+    github_links = read_lines(github_file)
 
     # Add certifications
     if certs_links:
-        paragraph2 = doc.add_paragraph("CERTIFICATES - LAST 3 YEARS")
+        paragraph2 = sentinel.insert_paragraph_before(
+            "CERTIFICATES - LAST 3 YEARS"
+        )
         paragraph2.style = "Heading 1"
         paragraph2.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        doc.add_paragraph("\n" + "\n".join(certs_links))
+        sentinel.insert_paragraph_before("\n" + "\n".join(certs_links))
 
     # Add GitHub links
     if github_links:
-        paragraph3 = doc.add_paragraph("LINKEDIN/GITHUB")
+        paragraph3 = sentinel.insert_paragraph_before("LINKEDIN/GITHUB")
         paragraph3.style = "Heading 1"
         paragraph3.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        doc.add_paragraph("\n" + "\n".join(github_links) + "\n")
+        sentinel.insert_paragraph_before(
+            "\n" + "\n".join(github_links) + "\n"
+        )
 
     # Add soft skills
     soft_skills = [
@@ -174,78 +390,71 @@ def word_cv_prepare(
         "COMMUNICATION",
         "PROBLEM SOLVING"
     ]
-    paragraph4 = doc.add_paragraph("SOFT SKILLS")
+    paragraph4 = sentinel.insert_paragraph_before("SOFT SKILLS")
     paragraph4.style = "Heading 1"
     paragraph4.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    doc.add_paragraph("\n" + ", ".join(soft_skills) + "\n")
+    sentinel.insert_paragraph_before("\n" + ", ".join(soft_skills) + "\n")
 
     # Add hobbies
     hobbies = ["READING", "MOTORCYCLING", "CLIMBING", "MARTIAL ARTS"]
-    paragraph5 = doc.add_paragraph("HOBBIES")
+    paragraph5 = sentinel.insert_paragraph_before("HOBBIES")
     paragraph5.style = "Heading 1"
     paragraph5.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    paragraph5a = doc.add_paragraph("\n" + ", ".join(hobbies))
+    paragraph5a = sentinel.insert_paragraph_before("\n" + ", ".join(hobbies))
     paragraph5a.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
 
     # Save the document
+    cv_path = os.path.join(
+        save_dir, f"Przemyslaw_Tutur_{doc_name_position}.docx"
+    )
+    extended_path = os.path.join(
+        save_dir, f"Przemyslaw_Tutur_{doc_name_position}_extended.docx"
+    )
+    messages = []
     try:
-        doc.save(os.path.join(
-            save_dir, f"Przemyslaw_Tutur_{doc_name_position}.docx")
-        )
+        doc.save(cv_path)
     except OSError as e:
-        print(f"Error saving document: {e}")
+        messages.append(f"Error saving document: {e}")
 
     # Append - PROJECTS.docx with custom formatting based on tags
     projects_path = os.path.join(working_dir, "PROJECTS.docx")
     if os.path.exists(projects_path):
-        projects_doc = docx.Document(projects_path)
-        doc.add_page_break()
-
-        for para in projects_doc.paragraphs:
-            text = para.text.strip()
-
-            if text.startswith("<main-info>"):
-                # Main section - "MAIN PROJECTS"
-                main_info_paragraph = doc.add_paragraph(text.replace("<main-info>", "").strip())
-                main_info_paragraph.style = "Heading 1"
-            elif text.startswith("<company>"):
-                # Company name- bolded
-                company_paragraph = doc.add_paragraph()
-                company_run = company_paragraph.add_run(text.replace("<company>", "").strip())
-                company_run.bold = True
-                company_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
-            elif text.startswith("<project>"):
-                # Project - tabulation + bold
-                project_paragraph = doc.add_paragraph(text.replace("<project>", "").strip())
-                project_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
-                project_paragraph.paragraph_format.first_line_indent = docx.shared.Pt(0)
-                project_run = project_paragraph.runs[0]
-                project_run.bold = True
-            elif text.startswith("<project-desc>"):
-                # Project description - double tabulation
-                project_desc_paragraph = doc.add_paragraph(text.replace("<project-desc>", "").strip())
-                project_desc_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
-                project_desc_paragraph.paragraph_format.first_line_indent = docx.shared.Pt(0)
-            elif text.startswith("<project-skills>"):
-                # Skills - double tabulation
-                project_skills_paragraph = doc.add_paragraph(text.replace("<project-skills>", "").strip())
-                project_skills_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
-                project_skills_paragraph.paragraph_format.first_line_indent = docx.shared.Pt(36)
+        sentinel.insert_paragraph_before().add_run().add_break(WD_BREAK.PAGE)
+
+        for text in read_docx_paragraphs(projects_path):
+            match = PROJECT_TAG_PATTERN.match(text)
+            if match:
+                tag_format = PROJECT_TAG_FORMATS[match.group(1)]
+                text = text[match.end():]
             else:
                 # other possibilities - if exists
-                other_paragraph = doc.add_paragraph(text)
-                other_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
+                tag_format = PROJECT_OTHER_FORMAT
+            style, bold, first_line_indent, justify = tag_format
+
+            project_paragraph = sentinel.insert_paragraph_before(style=style)
+            project_run = project_paragraph.add_run(text)
+            if bold:
+                project_run.bold = True
+            if justify:
+                project_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
+            if first_line_indent is not None:
+                project_paragraph.paragraph_format.first_line_indent = Pt(
+                    first_line_indent
+                )
 
     try:
-        doc.save(os.path.join(save_dir, f"Przemyslaw_Tutur_{doc_name_position}_extended.docx"))
+        doc.save(extended_path)
     except OSError as e:
-        print(f"Error saving document: {e}")
+        messages.append(f"Error saving document: {e}")
+    if not messages:
+        CV_CACHE[cache_key] = (destination, cv_path, extended_path)
+    return messages
 
 
 def generate_cover_letter(
         working_dir: str, job_title: str, company_name: str, job_url: str,
-        skills: List[str], soft_skills: List[str]
-) -> None:
+        skills: List[str], soft_skills: List[str], date: str = None
+) -> str:
     """
     Generate and save a cover letter for a job application.
 
@@ -257,22 +466,29 @@ def generate_cover_letter(
     job_url: Job URL to include in the cover letter.
     skills: List of hard skills to include in the cover letter.
     soft_skills: List of soft skills to include in the cover letter.
+    date: Date in ISO format put on the letter, defaults to today.
 
     Returns
     -------
-    None
+    Message telling where the cover letter was saved.
     """
+    import docx
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+
     technical_skills = ", ".join(skills)
     soft_skills_str = ", ".join(soft_skills)
 
     doc = docx.Document()
-    doc.add_heading("Cover Letter", 0)
-    p1 = doc.add_paragraph(f"Date: {datetime.datetime.now().strftime('%Y-%m-%d')}")
+    # Trailing sentinel - new paragraphs are inserted before it
+    sentinel = doc.add_paragraph()
+    sentinel.insert_paragraph_before("Cover Letter", style="Title")
+    date = date or datetime.date.today().isoformat()
+    p1 = sentinel.insert_paragraph_before(f"Date: {date}")
     p1.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    doc.add_paragraph("Dear Hiring Manager,")
+    sentinel.insert_paragraph_before("Dear Hiring Manager,")
 
     # Initial paragraphs
-    doc.add_paragraph(
+    sentinel.insert_paragraph_before(
         f"I am writing to express my interest in the {job_title} position at "
         f"{company_name}. I found this job listing on {job_url} and believe "
         f"that my skills and experience make me a strong candidate for this "
@@ -280,7 +496,7 @@ def generate_cover_letter(
     )
 
     # Paragraph for technical skills
-    p = doc.add_paragraph(
+    p = sentinel.insert_paragraph_before(
         f"I have extensive experience in the required technical skills mentioned in the "
         f"job description, including {technical_skills}. I am confident that my "
         f"background and knowledge will enable me to contribute effectively "
@@ -289,7 +505,7 @@ def generate_cover_letter(
     p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
 
     # Paragraph for soft skills
-    p = doc.add_paragraph(
+    p = sentinel.insert_paragraph_before(
         f"In addition to my technical expertise, I possess strong soft skills such as {soft_skills_str}. "
         f"These skills have enabled me to work collaboratively and effectively in team environments, "
         f"and to manage time and projects efficiently."
@@ -297,15 +513,15 @@ def generate_cover_letter(
     p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
 
     # Additional paragraphs with justified alignment
-    p = doc.add_paragraph(
+    p = sentinel.insert_paragraph_before(
         "I look forward to the opportunity to discuss how my skills and "
         "experiences align with the needs of your team. Thank you for "
         "considering my application."
     )
     p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
 
-    doc.add_paragraph("Sincerely,")
-    doc.add_paragraph("Przemyslaw Tutur")
+    sentinel.insert_paragraph_before("Sincerely,")
+    sentinel.insert_paragraph_before("Przemyslaw Tutur")
 
     # Add footer
     section = doc.sections[0]
@@ -315,135 +531,251 @@ def generate_cover_letter(
         f"This motivation letter was generated and submitted for the "
         f"{job_title} position. Please contact me directly if you wish to use it for any other position."
     )
-    footer_para_run.font.name = "Times New Roman"
-    footer_para_run.font.bold = True
-    footer_para_run.font.size = Pt(8)
+    footer_para_run.style = footer_note_style(doc)
 
     cover_letter_path = os.path.join(
         working_dir, f"Cover_Letter_{sanitize_filename(job_title)}.docx"
     )
     doc.save(cover_letter_path)
-    print(f"Cover letter saved to {cover_letter_path}")
+    return f"Cover letter saved to {cover_letter_path}"
 
 
-def take_job_description(dir: str, url: str) -> None:
+def fetch_job_description(url: str) -> str:
+    """
+    Download a job offer page and return its description.
+
+    Parameters
+    ----------
+    url: URL of the job description.
+
+    Returns
+    -------
+    Job description text, empty if the page holds no offer data.
+    """
+    resp = SESSION.get(url, timeout=10)
+    match = NEXT_DATA_PATTERN.search(resp.content)
+    if not match:
+        return ""
+
+    # Konwertuj JSON-encoded string do słownika
+    offer = json.loads(match.group(1))['props']['pageProps']['offer']
+    return "".join([
+        f"Job URL: {url}\n\n",
+        offer["title"],
+        str(offer['companyName']),
+        str(offer["employmentTypes"]),
+        str(offer['body']),
+        str(offer['experienceLevel']),
+    ])
+
+
+def take_job_description(dir: str, url: str) -> List[str]:
     """
     Retrieve and save the job description from a given URL.
 
     Parameters
     ----------
-    dir: The directory where the job description will be saved.
+    dir: Directory where the job description will be saved.
     url: URL of the job description.
 
     Returns
     -------
-    None
+    Messages about the job description that could not be saved.
     """
     try:
-        resp = requests.get(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
-        target_div_content = soup.find("div", class_="MuiBox-root css-7nl6k4")
-        if target_div_content:
+        description = fetch_job_description(url)
+        if description:
             with open(
-                os.path.join(dir, "job_description.txt"), "w", encoding="utf-8"
+                os.path.join(dir, "job_description.txt"), "wb"
             ) as fdescriptor:
-                fdescriptor.write(target_div_content.text)
-        else:
-            print("The specified div was not found.")
+                fdescriptor.write(description.encode("utf-8"))
+            return []
+        return ["The specified div was not found."]
     except Exception as e:
-        print(f"Error taking job description: {e}")
+        return [f"Error taking job description: {e}"]
 
 
-def request(
-    working_dir: str, current_skills: List[str], url: str
+def read_csv_header(file_path: str) -> List[str]:
+    """
+    Read the column names from the first row of a CSV file.
+
+    Parameters
+    ----------
+    file_path: Path to the CSV file.
+
+    Returns
+    -------
+    Column names, empty for an empty file.
+    """
+    with open(file_path, newline="", encoding="utf-8") as file:
+        return next(csv.reader(file), [])
+
+
+def read_jobs_csv(
+    file_path: str, columns: Optional[List[str]] = None, **kwargs
 ) -> pd.DataFrame:
     """
-    Send a request to a job listing URL, process the data, and save it.
+    Read a CSV file with job data, keeping only the known columns.
+
+    The multithreaded pyarrow parser is used when pyarrow is installed,
+    otherwise the pandas C parser. The C parser is also the fallback for
+    files pyarrow rejects, such as rows with more fields than the header.
 
     Parameters
     ----------
-    working_dir: Base working directory.
-    current_skills: List of current skills to match against job listings.
-    url: URL of the job listings.
+    file_path: Path to the CSV file.
+    columns: Columns to read, all known columns by default.
+    kwargs: Additional keyword arguments passed to pandas.read_csv.
 
     Returns
     -------
-    DataFrame containing the processed job data.
+    DataFrame containing the job data.
     """
-    try:
-        # Clear the current output data CSV file
-        file_path = os.path.join(working_dir, "output_data.csv")
-        if os.path.exists(file_path):
-            os.remove(file_path)
+    import pandas as pd
 
-        resp = requests.get(url)
-        int_resp = requests.get(url)
-        json_string = str(
-            int_resp.text.split('{"pages":')[1].split('"meta":')[0].rstrip(",")
-            + "}]"
+    # pyarrow only takes a list of columns that all exist in the file
+    wanted = CSV_DTYPES if columns is None else columns
+    usecols = [
+        column for column in read_csv_header(file_path)
+        if column in wanted and column in CSV_DTYPES
+    ]
+
+    try:
+        return pd.read_csv(
+            file_path, dtype=CSV_DTYPES, usecols=usecols, engine="pyarrow",
+            **kwargs
+        )
+    except (ImportError, pd.errors.ParserError):
+        # The C parser drops the fields outside usecols instead of failing
+        return pd.read_csv(
+            file_path, dtype=CSV_DTYPES, usecols=usecols, engine="c",
+            **kwargs
         )
-        data_set = json.loads(json_string)
-        data_list = []
-        for data in data_set[0]["data"]:
-            sub_url = "https://justjoin.it/offers/" + data["slug"]
-            row = {
-                "TITLE": data["title"],
-                "REQUIRED_SKILLS": str(data["requiredSkills"]),
-                "ADDITIONAL_SKILLS": str(data["niceToHaveSkills"]),
-                "WORKPLACE_TYPE": data["workplaceType"],
-                "REMOTE_INTERVIEW": data["remoteInterview"],
-                "URL": sub_url,
-                "PAYMENT_FROM": str(data["employmentTypes"][0]["fromPln"]),
-                "PAYMENT_TO": str(data["employmentTypes"][0]["toPln"]),
-                "LOCATION": data.get("city", "Unknown"),
-                "COMPANY": data.get("companyName", "Unknown"),
-                "DATE": datetime.datetime.now().strftime("%Y-%m-%d"),
-            }
-            data_list.append(row)
-            directory = create_working_dir(working_dir, data["slug"])
-            take_job_description(directory, sub_url)
-            word_cv_prepare(
-                working_dir,
-                directory,
-                data["requiredSkills"],
-                data["title"],
-                current_skills,
-            )
-            soft_skills = [
-                "adaptability",
-                "time management",
-                "team leadership",
-                "communication",
-                "problem solving"
-            ]
-            generate_cover_letter(
-                directory,
-                data["title"],
-                data.get("companyName", "Unknown"),
-                sub_url,
-                data["requiredSkills"],
-                soft_skills
-            )
-            print("Processed:", data["title"])
-        df = pd.DataFrame(data_list)
-        write_header = not os.path.exists(file_path)
-        df.to_csv(file_path, mode="a", index=False, header=write_header)
 
-        # Append to the output_whole.csv
-        whole_file_path = os.path.join(working_dir, "output_whole.csv")
-        df.to_csv(
-            whole_file_path, mode="a", index=False,
-            header=not os.path.exists(whole_file_path)
+
+def append_columns_to_csv(file_paths: List[str], columns: dict) -> None:
+    """
+    Append rows to CSV files, writing the header to files that are empty.
+
+    Parameters
+    ----------
+    file_paths: Paths of the CSV files to append the rows to.
+    columns: Column name -> list of values, all lists of the same length.
+
+    Returns
+    -------
+    None
+    """
+    rows = list(zip(*columns.values()))
+    if not rows:
+        return
+
+    # Format the rows once and write the same text to every file
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator=os.linesep)
+    writer.writerow(columns)
+    header_end = buffer.tell()
+    writer.writerows(rows)
+    content = buffer.getvalue()
+
+    for file_path in file_paths:
+        with open(
+            file_path, "a", buffering=1 << 20, newline="", encoding="utf-8"
+        ) as file:
+            # Append mode starts at the end, so an empty file needs a header
+            file.write(content if file.tell() == 0 else content[header_end:])
+
+
+def prepare_documents(
+    working_dir: str, directory: str, current_skills: List[str], data: dict,
+    today: str
+) -> List[str]:
+    """
+    Save the CV and cover letter for a single job offer.
+
+    Parameters
+    ----------
+    working_dir: Base working directory.
+    directory: Directory of the job offer where the documents are saved.
+    current_skills: List of current skills to include in the CV.
+    data: Job offer entry taken from the job listing.
+    today: Date of the request in ISO format.
+
+    Returns
+    -------
+    Messages about the prepared documents.
+    """
+    sub_url = "https://justjoin.it/offers/" + data["slug"]
+    messages = word_cv_prepare(
+        working_dir,
+        directory,
+        data["requiredSkills"],
+        data["title"],
+        current_skills,
+    )
+    soft_skills = [
+        "adaptability",
+        "time management",
+        "team leadership",
+        "communication",
+        "problem solving"
+    ]
+    messages.append(generate_cover_letter(
+        directory,
+        data["title"],
+        data.get("companyName", "Unknown"),
+        sub_url,
+        data["requiredSkills"],
+        soft_skills=soft_skills,
+        date=today
+    ))
+    messages.append(f"Processed: {data['title']}")
+    return messages
+
+
+def offer_columns(offers: List[dict], date: str, job_type: str) -> dict:
+    """
+    Turn job listing offers into the values of the CSV columns.
+
+    The data is kept column by column, so a DataFrame gets one list per
+    column instead of a dict per offer.
+
+    Parameters
+    ----------
+    offers: Job offer entries taken from the job listing.
+    date: Date of the request in ISO format.
+    job_type: Job type to be added to the rows.
+
+    Returns
+    -------
+    Column name -> list of values, for every column in OFFER_COLUMNS.
+    """
+    columns = {column: [] for column in OFFER_COLUMNS}
+    for data in offers:
+        employment = (
+            data["employmentTypes"][0] if data.get("employmentTypes") else {}
         )
+        columns["TITLE"].append(data.get("title", ""))
+        columns["REQUIRED_SKILLS"].append(json.dumps(
+            data.get("requiredSkills") or [], ensure_ascii=False
+        ))
+        columns["ADDITIONAL_SKILLS"].append(json.dumps(
+            data.get("niceToHaveSkills") or [], ensure_ascii=False
+        ))
+        columns["WORKPLACE_TYPE"].append(data.get("workplaceType", ""))
+        columns["REMOTE_INTERVIEW"].append(data.get("remoteInterview", ""))
+        columns["URL"].append("https://justjoin.it/offers/" + data["slug"])
+        columns["PAYMENT_FROM"].append(to_float(employment.get("fromPln")))
+        columns["PAYMENT_TO"].append(to_float(employment.get("toPln")))
+        columns["LOCATION"].append(data.get("city", "Unknown"))
+        columns["COMPANY"].append(data.get("companyName", "Unknown"))
+    columns["DATE"] = [date] * len(offers)
+    columns["JOB_TYPE"] = [job_type] * len(offers)
+    return columns
 
-        print("Data appended to CSV.")
-        return df
-    except Exception as e:
-        print(f"Error processing request: {e}")
-        return pd.DataFrame()  # Return empty DataFrame on error
 
 def request(
-    working_dir: str, current_skills: List[str], url: str, job_type: str
+    working_dir: str, current_skills: List[str], url: str, job_type: str = ""
 ) -> pd.DataFrame:
     """
     Send a request to a job listing URL, process the data, and save it.
@@ -459,76 +791,61 @@ def request(
     -------
     DataFrame containing the processed job data.
     """
+    import pandas as pd
+
     try:
+        clear_document_caches()
         # Clear the current output data CSV file
         file_path = os.path.join(working_dir, "output_data.csv")
         if os.path.exists(file_path):
             os.remove(file_path)
 
-        resp = requests.get(url)
-        int_resp = requests.get(url)
-        json_string = str(
-            int_resp.text.split('{"pages":')[1].split('"meta":')[0].rstrip(",")
-            + "}]"
+        resp = SESSION.get(url, timeout=10)
+        data_set = extract_pages(resp.content)
+        current_skills_set = frozenset(
+            skill.lower() for skill in current_skills
         )
-        data_set = json.loads(json_string)
-        data_list = []
-        for data in data_set[0]["data"]:
-            sub_url = "https://justjoin.it/offers/" + data["slug"]
-            required_skills = str(data["requiredSkills"])
-            match_percentage = skill_match_percentage(required_skills,
-                                                      current_skills)
-            row = {
-                "TITLE": data["title"],
-                "REQUIRED_SKILLS": str(data["requiredSkills"]),
-                "ADDITIONAL_SKILLS": str(data["niceToHaveSkills"]),
-                "WORKPLACE_TYPE": data["workplaceType"],
-                "REMOTE_INTERVIEW": data["remoteInterview"],
-                "URL": sub_url,
-                "PAYMENT_FROM": str(data["employmentTypes"][0]["fromPln"]),
-                "PAYMENT_TO": str(data["employmentTypes"][0]["toPln"]),
-                "LOCATION": data.get("city", "Unknown"),
-                "COMPANY": data.get("companyName", "Unknown"),
-                "DATE": datetime.datetime.now().strftime("%Y-%m-%d"),
-                "JOB_TYPE": job_type, # Add job type to the row
-                "MATCH_PERCENTAGE": match_percentage
-            }
-            data_list.append(row)
-            directory = create_working_dir(working_dir, data["slug"])
-            take_job_description(directory, sub_url)
-            word_cv_prepare(
-                working_dir,
-                directory,
-                data["requiredSkills"],
-                data["title"],
-                current_skills,
-            )
-            soft_skills = [
-                "adaptability",
-                "time management",
-                "team leadership",
-                "communication",
-                "problem solving"
-            ]
-            generate_cover_letter(
-                directory,
-                data["title"],
-                data.get("companyName", "Unknown"),
-                sub_url,
-                data["requiredSkills"],
-                soft_skills=soft_skills
+        now = datetime.datetime.now()
+        today = now.date().isoformat()
+        timestamp = now.strftime(TIMESTAMP_FORMAT)
+        offers = data_set[0]["data"]
+        columns = offer_columns(offers, today, job_type)
+        directories = [
+            create_working_dir(working_dir, data["slug"], timestamp)
+            for data in offers
+        ]
+
+        # Job descriptions wait on the network and the documents on the
+        # disk, so both kinds of work run in their own pools side by side
+        with ThreadPoolExecutor(max_workers=16) as fetch_executor, \
+                ThreadPoolExecutor(max_workers=4) as documents_executor:
+            futures = []
+            for data, directory, sub_url in zip(
+                offers, directories, columns["URL"]
+            ):
+                futures.append(fetch_executor.submit(
+                    take_job_description, directory, sub_url
+                ))
+                futures.append(documents_executor.submit(
+                    prepare_documents,
+                    working_dir, directory, current_skills, data, today
+                ))
+            # The tasks return their messages, which are printed here in
+            # the order of the offers so the lines of the threads do not
+            # run together
+            for future in futures:
+                for message in future.result():
+                    print(message)
+        columns["MATCH_PERCENTAGE"] = [
+            skill_match_percentage(
+                data["requiredSkills"] or [], current_skills_set
             )
-            print("Processed:", data["title"])
-        df = pd.DataFrame(data_list)
-        write_header = not os.path.exists(file_path)
-        df.to_csv(file_path, mode="a", index=False, header=write_header)
-
-        # Append to the output_whole.csv
+            for data in offers
+        ]
+        # Append to the output_data.csv and output_whole.csv
         whole_file_path = os.path.join(working_dir, "output_whole.csv")
-        df.to_csv(
-            whole_file_path, mode="a", index=False,
-            header=not os.path.exists(whole_file_path)
-        )
+        append_columns_to_csv([file_path, whole_file_path], columns)
+        df = pd.DataFrame(columns) if offers else pd.DataFrame()
 
         print("Data appended to CSV.")
         return df
@@ -537,8 +854,23 @@ def request(
         return pd.DataFrame()  # Return empty DataFrame on error
 
 
+def to_float(value) -> Optional[float]:
+    """
+    Convert a payment value from the job listing to a float.
+
+    Parameters
+    ----------
+    value: Payment value, None when the offer does not state it.
+
+    Returns
+    -------
+    Payment as a float, None for a missing payment.
+    """
+    return float(value) if value is not None else None
+
+
 def skill_match_percentage(
-    required_skills: List[str], current_skills: List[str]
+    required_skills: List[str], current_skills_set: FrozenSet[str]
 ) -> float:
     """
     Calculate the percentage of matching skills between required skills
@@ -547,7 +879,7 @@ def skill_match_percentage(
     Parameters
     ----------
     required_skills: List of required skills for a job.
-    current_skills: List of current skills of the user.
+    current_skills_set: Lowercased current skills of the user.
 
     Returns
     -------
@@ -557,89 +889,43 @@ def skill_match_percentage(
         return 0.0
 
     required_skills_lower = [skill.lower() for skill in required_skills]
-    current_skills_lower = [skill.lower() for skill in current_skills]
-
-    matched_skills = set(required_skills_lower).intersection(
-        set(current_skills_lower))
-    return len(matched_skills) / len(required_skills_lower) * 100
+    matched_skills = current_skills_set.intersection(required_skills_lower)
+    return 100.0 * len(matched_skills) / len(required_skills_lower)
 
 
 def generate_summary(working_dir: str, df: pd.DataFrame,
                      skills_file: str) -> None:
     summary_path = os.path.join(working_dir, "summary.txt")
-    with open(summary_path, "w", encoding="utf-8") as summary_file:
-        for index, row in df.iterrows():
-            job_title = row['TITLE']
-            match_percentage = row['MATCH_PERCENTAGE']
-            url = row['URL']
-            required_skills = [skill.lower() for skill in
-                               eval(row['REQUIRED_SKILLS'])] if isinstance(
-                row['REQUIRED_SKILLS'], str) else []
-
-            with open(skills_file, "r") as file:
-                all_skills = [line.strip().lower() for line in file.readlines()]
-
-            missing_skills = set(required_skills) - set(all_skills)
-            missing_skills_str = ", ".join(missing_skills)
-
-            summary_file.write(f"{job_title}\n")
-            summary_file.write(
-                f"Procent pasujacych skilli: {match_percentage}%\n")
-            summary_file.write(
-                "Lista skilli ktorych nie ma na liscie skills.txt: "
-                f"{missing_skills_str}\n"
-            )
-            summary_file.write(f"URL: {url}\n")
-            summary_file.write(f"----------------\n")
-
-
-def take_job_description(dir: str, url: str) -> None:
-    """
-    Retrieve and save the job description from a given URL.
+    if df.empty:
+        # Nothing to summarize - skills.txt is not needed for an empty file
+        open(summary_path, "w", encoding="utf-8").close()
+        return
 
-    Parameters
-    ----------
-    dir: Directory where the job description will be saved.
-    url: URL of the job description.
+    with open(skills_file, "r") as file:
+        all_skills = frozenset(line.strip().lower() for line in file)
 
-    Returns
-    -------
-    None
-    """
-    try:
-        resp = requests.get(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
-        target_div_content = soup.find_all("script")
-
-        json_data = None
-        for script in target_div_content:
-            if 'body' in script.text:
-                json_data = script.text
-                break
+    # Parse the whole skills column once instead of row by row
+    rows = zip(
+        df["TITLE"], df["MATCH_PERCENTAGE"], df["URL"],
+        df["REQUIRED_SKILLS"].map(
+            lambda skills: json.loads(skills) if isinstance(skills, str) else []
+        ),
+    )
 
-        if json_data:
-            # Konwertuj JSON-encoded string do słownika
-            data = json.loads(json_data)
-            #data['props']['pageProps']['offer']['body']
+    chunks = []
+    for job_title, match_percentage, url, skills in rows:
+        required_skills = {skill.lower() for skill in skills}
+        missing_skills = required_skills - all_skills
+        missing_skills_str = ", ".join(missing_skills)
+
+        chunks.append(
+            f"{job_title}\n"
+            f"Procent pasujacych skilli: {match_percentage}%\n"
+            "Lista skilli ktorych nie ma na liscie skills.txt: "
+            f"{missing_skills_str}\n"
+            f"URL: {url}\n"
+            "----------------\n"
+        )
 
-            with open(
-                os.path.join(dir, "job_description.txt"), "w", encoding="utf-8"
-            ) as fdescriptor:
-                fdescriptor.write(f"Job URL: {url}\n\n")
-                fdescriptor.write(data['props']['pageProps']['offer']["title"])
-                fdescriptor.write(
-                    str(data['props']['pageProps']['offer']['companyName'])
-                )
-                fdescriptor.write(
-                    str(data['props']['pageProps']['offer']["employmentTypes"])
-                )
-                fdescriptor.write(
-                    str(data['props']['pageProps']['offer']['body'])
-                )
-                fdescriptor.write(
-                    str(data['props']['pageProps']['offer']['experienceLevel'])
-                )
-        else:
-            print("The specified div was not found.")
-    except Exception as e:
-        print(f"Error taking job description: {e}")
+    with open(summary_path, "w", encoding="utf-8") as summary_file:
+        summary_file.write("".join(chunks))
@@ -1,39 +1,18 @@
 """main.py - main project file."""
+from __future__ import annotations
+
 import os
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox
-import pandas as pd
-import data_processing as dp
-import visualization as vz
-import whole
-
-# Urls definitions for different job offers
-urls = {
-    "JavaScript": "https://justjoin.it/all-locations/javascript",
-    "HTML": "https://justjoin.it/all-locations/html",
-    "PHP": "https://justjoin.it/all-locations/php",
-    "Ruby": "https://justjoin.it/all-locations/ruby",
-    "Python": "https://justjoin.it/all-locations/python",
-    "Java": "https://justjoin.it/all-locations/java",
-    ".NET": "https://justjoin.it/all-locations/net",
-    "Scala": "https://justjoin.it/all-locations/scala",
-    "C": "https://justjoin.it/all-locations/c",
-    "Mobile": "https://justjoin.it/all-locations/mobile",
-    "Testing": "https://justjoin.it/all-locations/testing",
-    "DevOps": "https://justjoin.it/all-locations/devops",
-    "Admin": "https://justjoin.it/all-locations/admin",
-    "UX": "https://justjoin.it/all-locations/ux",
-    "PM": "https://justjoin.it/all-locations/pm",
-    "Game": "https://justjoin.it/all-locations/game",
-    "Analytics": "https://justjoin.it/all-locations/analytics",
-    "Security": "https://justjoin.it/all-locations/security",
-    "Data": "https://justjoin.it/all-locations/data",
-    "Go": "https://justjoin.it/all-locations/go",
-    "Support": "https://justjoin.it/all-locations/support",
-    "ERP": "https://justjoin.it/all-locations/erp",
-    "Architecture": "https://justjoin.it/all-locations/architecture",
-    "Other": "https://justjoin.it/all-locations/other",
-}
+from typing import TYPE_CHECKING
+from urls import URL_KEYS, urls
+
+# pandas, matplotlib and the modules built on them are slow to import -
+# they are imported lazily when a button needs them, so the window
+# shows up at once
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Working directory global settings
 working_dir = ""
@@ -70,6 +49,8 @@ def analyze_data(df: pd.DataFrame) -> None:
     -------
     None
     """
+    import visualization as vz
+
     model_from, model_to = vz.analyze_data(df)
     messagebox.showinfo("Info", "Data analysis completed.")
 
@@ -86,6 +67,8 @@ def visualize_data(df: pd.DataFrame) -> None:
     -------
     None
     """
+    import visualization as vz
+
     most_common_skills, high_salary_skills = vz.visualize_data(df)
     most_common_skills_str = most_common_skills.to_string()
     high_salary_skills_str = high_salary_skills.to_string()
@@ -111,7 +94,7 @@ class App(tk.Tk):
         self.title("Job Scraper")
         self.geometry("540x220")
         self.url_var = tk.StringVar(self)
-        self.url_var.set(next(iter(urls)))
+        self.url_var.set(URL_KEYS[0])
         self.experience_level_var = tk.StringVar(self)
         self.experience_level_var.set("junior")
         self.remote_var = tk.BooleanVar(self)
@@ -130,7 +113,7 @@ class App(tk.Tk):
         tk.Label(self, text="Select Job Type", width=20).grid(
             row=0, column=0, padx=10, pady=5
         )
-        tk.OptionMenu(self, self.url_var, *urls.keys()).grid(
+        tk.OptionMenu(self, self.url_var, *URL_KEYS).grid(
             row=1, column=0, padx=10, pady=5, sticky="ew"
         )
 
@@ -163,36 +146,57 @@ class App(tk.Tk):
         ).grid(
             row=1, column=1, padx=10, pady=5
         )
-        tk.Button(
+        self.scrape_button = tk.Button(
             self, text="Scrape Jobs", command=self.scrape_jobs, width=20
-        ).grid(
-            row=2, column=1, padx=10, pady=5
         )
+        self.scrape_button.grid(row=2, column=1, padx=10, pady=5)
 
-        analyze_button = tk.Button(
+        self.analyze_button = tk.Button(
             self,
             text="Analyze Data",
             command=self.analyze_data,
             bg="lightgreen",
             width=20
         )
-        analyze_button.grid(row=0, column=2, padx=10, pady=5)
-        visualize_button = tk.Button(
+        self.analyze_button.grid(row=0, column=2, padx=10, pady=5)
+        self.visualize_button = tk.Button(
             self,
             text="Visualize Data",
             command=self.visualize_data,
             bg="lightgreen",
             width=20,
         )
-        visualize_button.grid(row=1, column=2, padx=10, pady=5)
-        whole_analysis_button = tk.Button(
+        self.visualize_button.grid(row=1, column=2, padx=10, pady=5)
+        self.whole_analysis_button = tk.Button(
             self,
             text="Whole Analyze",
             command=self.run_whole_analysis,
             bg="lightcoral",
             width=20,
         )
-        whole_analysis_button.grid(row=2, column=2, padx=10, pady=5)
+        self.whole_analysis_button.grid(row=2, column=2, padx=10, pady=5)
+
+    def set_scraping(self, scraping: bool) -> None:
+        """
+        Disable the CSV buttons while a scrape runs in the background.
+
+        Both scrapes write the CSV output files, so only one may run at a
+        time, and the analysis must not read a file that is being
+        rewritten.
+
+        Parameters
+        ----------
+        scraping: True when a scrape starts, False when it has finished.
+
+        Return:
+        -------
+        None
+        """
+        state = tk.DISABLED if scraping else tk.NORMAL
+        self.scrape_button.config(state=state)
+        self.whole_analysis_button.config(state=state)
+        self.analyze_button.config(state=state)
+        self.visualize_button.config(state=state)
 
     def set_working_directory(self) -> None:
         """
@@ -249,30 +253,19 @@ class App(tk.Tk):
                 url += "/remote_yes"
 
             if working_dir:
+                self.set_scraping(True)
                 # Clear the output file before scraping
                 output_file_path = os.path.join(working_dir, "output_data.csv")
                 if os.path.exists(output_file_path):
                     os.remove(output_file_path)
 
-                # df = dp.request(working_dir, current_skills, url)
-                df = dp.request(working_dir, current_skills, url, url_key)
-                dp.generate_summary(working_dir, df,
-                                    os.path.join(working_dir, "skills.txt"))
-
-                # Append to the output_whole.csv file
-                output_whole_file_path = os.path.join(working_dir, "output_whole.csv")
-                if os.path.exists(output_whole_file_path):
-                    df.to_csv(
-                        output_whole_file_path, mode="a", header=False, index=False
-                    )
-                else:
-                    df.to_csv(
-                        output_whole_file_path, mode="w", header=True, index=False
-                    )
-
-                messagebox.showinfo(
-                    "Info", "Jobs scraped successfully."
-                )
+                # Scraping waits on the network, it runs in the background
+                # so the window stays responsive
+                threading.Thread(
+                    target=self.scrape_in_background,
+                    args=(working_dir, list(current_skills), url, url_key),
+                    daemon=True,
+                ).start()
             else:
                 messagebox.showerror(
                     "Error", "Please set the working directory first."
@@ -282,6 +275,43 @@ class App(tk.Tk):
                 "Error", "Please select a job type."
             )
 
+    def scrape_in_background(
+        self, working_dir: str, current_skills: list, url: str, url_key: str
+    ) -> None:
+        """
+        Scrape jobs and report back to the window once they are saved.
+
+        Parameters
+        ----------
+        working_dir: Base working directory.
+        current_skills: List of current skills to match against job listings.
+        url: URL of the job listings.
+        url_key: Job type of the job listings.
+
+        Return:
+        -------
+        None
+        """
+        # Tk widgets may only be used from the main thread, the results
+        # are handed over to it with self.after
+        try:
+            import data_processing as dp
+
+            # df = dp.request(working_dir, current_skills, url)
+            df = dp.request(working_dir, current_skills, url, url_key)
+            # dp.request already appends the rows to output_whole.csv
+            dp.generate_summary(working_dir, df,
+                                os.path.join(working_dir, "skills.txt"))
+            self.after(
+                0, messagebox.showinfo, "Info", "Jobs scraped successfully."
+            )
+        except Exception as e:
+            self.after(
+                0, messagebox.showerror, "Error", f"Error scraping jobs: {e}"
+            )
+        finally:
+            self.after(0, self.set_scraping, False)
+
     def analyze_data(self) -> None:
         """
         Analyze the scraped job data.
@@ -292,9 +322,11 @@ class App(tk.Tk):
         -------
         None
         """
+        import data_processing as dp
+
         file_path = os.path.join(working_dir, "output_data.csv")
         if os.path.exists(file_path):
-            df = pd.read_csv(file_path, on_bad_lines="skip")
+            df = dp.read_jobs_csv(file_path, on_bad_lines="skip")
             analyze_data(df)
         else:
             messagebox.showerror(
@@ -311,9 +343,11 @@ class App(tk.Tk):
         -------
         None
         """
+        import data_processing as dp
+
         file_path = os.path.join(working_dir, "output_data.csv")
         if os.path.exists(file_path):
-            df = pd.read_csv(file_path, on_bad_lines="skip")
+            df = dp.read_jobs_csv(file_path, on_bad_lines="skip")
             visualize_data(df)
         else:
             messagebox.showerror(
@@ -330,8 +364,57 @@ class App(tk.Tk):
         -------
         None
         """
-        whole.main()
-        messagebox.showinfo("Info", "Whole analysis completed.")
+        self.set_scraping(True)
+        # Fetching runs in the background, the plots need the main thread
+        threading.Thread(
+            target=self.collect_whole_data, daemon=True
+        ).start()
+
+    def collect_whole_data(self) -> None:
+        """
+        Fetch the whole job data and hand it over to the main thread.
+
+        This method does not take any parameters.
+
+        Return:
+        -------
+        None
+        """
+        try:
+            import whole
+
+            file_path = whole.collect_job_data()
+        except Exception as e:
+            self.after(
+                0, messagebox.showerror, "Error",
+                f"Error fetching job data: {e}"
+            )
+            self.after(0, self.set_scraping, False)
+        else:
+            self.after(0, self.finish_whole_analysis, file_path)
+
+    def finish_whole_analysis(self, file_path: str) -> None:
+        """
+        Analyze and visualize the fetched whole job data.
+
+        Parameters
+        ----------
+        file_path: Path to the CSV file with the whole job data.
+
+        Return:
+        -------
+        None
+        """
+        import whole
+
+        try:
+            whole.analyze_and_visualize(file_path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Error analyzing job data: {e}")
+        else:
+            messagebox.showinfo("Info", "Whole analysis completed.")
+        finally:
+            self.set_scraping(False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,85 @@
+# conftest.py
+
+import json
+import os
+import shutil
+import sys
+
+import pytest
+
+# The modules live in the repository root, next to this directory
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import data_processing  # noqa: E402
+
+PYTHON_URL = "https://justjoin.it/all-locations/python"
+
+OFFERS = [
+    {
+        "slug": "acme-python", "title": "Python Dev",
+        "requiredSkills": ["Python", "SQL"], "niceToHaveSkills": None,
+        "workplaceType": "remote", "remoteInterview": True,
+        "employmentTypes": [{"fromPln": 10000, "toPln": 20000}],
+        "city": "Warszawa", "companyName": "Acme",
+    },
+    {
+        "slug": "b-go", "title": "Go Dev",
+        "requiredSkills": ["Go"], "niceToHaveSkills": ["K8s"],
+        "workplaceType": "office", "remoteInterview": False,
+        "employmentTypes": [{"fromPln": None, "toPln": None}],
+        "city": "Kraków", "companyName": "B",
+    },
+]
+
+
+def next_data_page(props: dict) -> bytes:
+    """Wrap the page props in the __NEXT_DATA__ script of a page."""
+    return (
+        '<script id="__NEXT_DATA__" type="application/json">'
+        + json.dumps({"props": {"pageProps": props}})
+        + "</script>"
+    ).encode()
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+
+def fake_get(url, timeout=None):
+    """
+    Serve the job listings and the offer pages without the network.
+
+    PYTHON_URL lists OFFERS, every other listing the same offers under
+    other slugs and titles.
+    """
+    if "/offers/" in url:
+        return FakeResponse(next_data_page({"offer": {
+            "title": "Dev", "companyName": "Acme", "employmentTypes": [],
+            "body": "<p>Job</p>", "experienceLevel": "mid",
+        }}))
+    offers = OFFERS if url == PYTHON_URL else [
+        dict(offer, slug="go-" + offer["slug"], title=offer["title"] + " II")
+        for offer in OFFERS
+    ]
+    pages = [{"data": offers, "meta": {}}]
+    return FakeResponse(next_data_page({"dehydratedState": {"queries": [
+        {"state": {"data": {"pages": pages}}}
+    ]}}))
+
+
+@pytest.fixture
+def fake_site(monkeypatch):
+    """Send the requests of the shared session to fake_get."""
+    monkeypatch.setattr(data_processing.SESSION, "get", fake_get)
+
+
+@pytest.fixture
+def working_dir(tmp_path):
+    """Working directory holding the source CV documents."""
+    for name in ("PT.docx", "PROJECTS.docx"):
+        shutil.copy(os.path.join(REPO_DIR, name), tmp_path)
+    return str(tmp_path)
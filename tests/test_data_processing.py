@@ -0,0 +1,112 @@
+# test_data_processing.py
+
+import os
+
+import pandas as pd
+import pytest
+
+import data_processing
+from conftest import PYTHON_URL
+
+HEADER = list(data_processing.OFFER_COLUMNS)
+ROW = [
+    "Python Dev", '["Python"]', "[]", "remote", "True",
+    "https://justjoin.it/offers/acme-python", "10000.0", "20000.0",
+    "Warszawa", "Acme", "2026-10-14", "Python",
+]
+
+
+@pytest.fixture
+def mixed_width_csv(tmp_path):
+    """CSV with the 12-column header and both 12- and 13-field rows."""
+    file_path = tmp_path / "output_whole.csv"
+    file_path.write_text(
+        "\n".join(",".join(row) for row in (HEADER, ROW, ROW + ["50.0"]))
+        + "\n",
+        encoding="utf-8",
+    )
+    return str(file_path)
+
+
+def check_mixed_width_frame(df: pd.DataFrame) -> None:
+    assert list(df.columns) == HEADER
+    assert len(df) == 2
+    assert df["PAYMENT_FROM"].tolist() == [10000.0, 10000.0]
+    assert df["JOB_TYPE"].tolist() == ["Python", "Python"]
+
+
+@pytest.fixture
+def engines(monkeypatch):
+    """Record the engine of every pandas.read_csv call."""
+    used = []
+    read_csv = pd.read_csv
+
+    def recording_read_csv(*args, **kwargs):
+        used.append(kwargs.get("engine"))
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", recording_read_csv)
+    return used
+
+
+def test_read_jobs_csv_with_pyarrow(mixed_width_csv, engines):
+    pytest.importorskip("pyarrow")
+    check_mixed_width_frame(data_processing.read_jobs_csv(mixed_width_csv))
+    assert engines == ["pyarrow", "c"]
+
+
+def test_read_jobs_csv_without_pyarrow(mixed_width_csv, engines, monkeypatch):
+    read_csv = pd.read_csv
+
+    def read_csv_without_pyarrow(*args, **kwargs):
+        if kwargs.get("engine") == "pyarrow":
+            raise ImportError("Missing optional dependency 'pyarrow'.")
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", read_csv_without_pyarrow)
+    check_mixed_width_frame(data_processing.read_jobs_csv(mixed_width_csv))
+    # The pyarrow call fails before it reaches the recording read_csv
+    assert engines == ["c"]
+
+
+def cv_texts(working_dir: str) -> list:
+    """Paragraph texts of the newest extended CV of the acme-python offer."""
+    import docx
+
+    directory = max(
+        name for name in os.listdir(working_dir)
+        if name.endswith("_acme_python")
+    )
+    cv_path = os.path.join(
+        working_dir, directory, "Przemyslaw_Tutur_Python_Dev_extended.docx"
+    )
+    return [para.text for para in docx.Document(cv_path).paragraphs]
+
+
+def test_request_uses_source_files_edited_after_the_last_request(
+    working_dir, fake_site
+):
+    data_processing.request(working_dir, ["python"], PYTHON_URL, "Python")
+    assert "CERTIFICATES - LAST 3 YEARS" not in cv_texts(working_dir)
+
+    certs = os.path.join(working_dir, "certs.txt")
+    with open(certs, "w", encoding="utf-8") as file:
+        file.write("https://example.com/cert\n")
+    data_processing.request(working_dir, ["python"], PYTHON_URL, "Python")
+    texts = cv_texts(working_dir)
+    assert "CERTIFICATES - LAST 3 YEARS" in texts
+    assert "\nhttps://example.com/cert" in texts
+
+
+def test_request_prints_messages_in_offer_order(
+    working_dir, fake_site, capsys
+):
+    data_processing.request(working_dir, ["python"], PYTHON_URL, "Python")
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split(" saved to ")[0] for line in lines] == [
+        "Cover letter", "Processed: Python Dev",
+        "Cover letter", "Processed: Go Dev",
+        "Data appended to CSV.",
+    ]
+    assert lines[0].endswith("Cover_Letter_Python_Dev.docx")
+    assert lines[2].endswith("Cover_Letter_Go_Dev.docx")
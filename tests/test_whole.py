@@ -0,0 +1,37 @@
+# test_whole.py
+
+import csv
+import os
+
+import data_processing
+import whole
+from conftest import PYTHON_URL
+
+GO_URL = "https://justjoin.it/all-locations/go"
+
+
+def read_rows(file_path: str) -> list:
+    with open(file_path, newline="", encoding="utf-8") as file:
+        return list(csv.reader(file))
+
+
+def test_request_and_whole_share_the_output_whole_layout(
+    working_dir, fake_site, monkeypatch
+):
+    monkeypatch.setattr(whole, "URL_ITEMS", (("Go", GO_URL),))
+    whole_file = os.path.join(working_dir, "output_whole.csv")
+
+    data_processing.request(working_dir, ["python"], PYTHON_URL, "Python")
+    whole.save_to_csv(whole.fetch_job_data(working_dir, []), whole_file)
+    data_processing.request(working_dir, ["python"], PYTHON_URL, "Python")
+
+    header, *rows = read_rows(whole_file)
+    assert header == list(data_processing.CSV_COLUMNS)
+    assert all(len(row) == len(header) for row in rows)
+    assert len(rows) == 6
+    match = header.index("MATCH_PERCENTAGE")
+    job_type = header.index("JOB_TYPE")
+    scored = [row[match] for row in rows if row[job_type] == "Python"]
+    assert scored == ["50.0", "0.0", "50.0", "0.0"]
+    assert [row[match] for row in rows if row[job_type] == "Go"] == ["", ""]
+    assert read_rows(os.path.join(working_dir, "output_data.csv"))[0] == header
@@ -0,0 +1,33 @@
+"""urls.py - job offer listing urls."""
+
+# Urls definitions for different job offers
+urls = {
+    "JavaScript": "https://justjoin.it/all-locations/javascript",
+    "HTML": "https://justjoin.it/all-locations/html",
+    "PHP": "https://justjoin.it/all-locations/php",
+    "Ruby": "https://justjoin.it/all-locations/ruby",
+    "Python": "https://justjoin.it/all-locations/python",
+    "Java": "https://justjoin.it/all-locations/java",
+    ".NET": "https://justjoin.it/all-locations/net",
+    "Scala": "https://justjoin.it/all-locations/scala",
+    "C": "https://justjoin.it/all-locations/c",
+    "Mobile": "https://justjoin.it/all-locations/mobile",
+    "Testing": "https://justjoin.it/all-locations/testing",
+    "DevOps": "https://justjoin.it/all-locations/devops",
+    "Admin": "https://justjoin.it/all-locations/admin",
+    "UX": "https://justjoin.it/all-locations/ux",
+    "PM": "https://justjoin.it/all-locations/pm",
+    "Game": "https://justjoin.it/all-locations/game",
+    "Analytics": "https://justjoin.it/all-locations/analytics",
+    "Security": "https://justjoin.it/all-locations/security",
+    "Data": "https://justjoin.it/all-locations/data",
+    "Go": "https://justjoin.it/all-locations/go",
+    "Support": "https://justjoin.it/all-locations/support",
+    "ERP": "https://justjoin.it/all-locations/erp",
+    "Architecture": "https://justjoin.it/all-locations/architecture",
+    "Other": "https://justjoin.it/all-locations/other",
+}
+
+# Job types and their urls in a fixed order, for iterating and menus
+URL_ITEMS = tuple(urls.items())
+URL_KEYS = tuple(urls)
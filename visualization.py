@@ -1,5 +1,9 @@
 """Visualization of processed data - visualization.py."""
 
+import ast
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
 import pandas as pd
 import matplotlib.pyplot as plt
 from sklearn.linear_model import LinearRegression
@@ -7,6 +11,128 @@ import numpy as np
 from sklearn.cluster import KMeans
 from typing import Tuple
 
+# Column holding the parsed REQUIRED_SKILLS lists
+SKILLS_COLUMN = "_SKILLS"
+PAYMENT_COLUMNS = ["PAYMENT_FROM", "PAYMENT_TO"]
+
+
+@lru_cache(maxsize=4096)
+def parse_skills(value: str) -> Tuple[str, ...]:
+    """
+    Parse a stored skills list, caching the result for repeated values.
+
+    Parameters
+    ----------
+    value: Skills list as stored in the CSV file.
+
+    Returns
+    -------
+    Tuple of skills, empty if the value is missing or not a list.
+    """
+    if not isinstance(value, str):
+        return ()
+    try:
+        skills = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return ()
+    return tuple(skills) if isinstance(skills, (list, tuple)) else ()
+
+
+def get_skills(df: pd.DataFrame) -> pd.Series:
+    """
+    Return the parsed required skills, parsing the column only once.
+
+    Parameters
+    ----------
+    df: DataFrame containing job data.
+
+    Returns
+    -------
+    Series with a tuple of required skills for each job offer.
+    """
+    if SKILLS_COLUMN not in df.columns:
+        df[SKILLS_COLUMN] = df["REQUIRED_SKILLS"].map(parse_skills)
+    return df[SKILLS_COLUMN]
+
+
+def attach_skill_lens(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the number of required and additional skills of each job offer.
+
+    Parameters
+    ----------
+    df: DataFrame containing job data, updated in place.
+
+    Returns
+    -------
+    The same DataFrame with REQUIRED_SKILLS_LEN and ADDITIONAL_SKILLS_LEN.
+    """
+    if "REQUIRED_SKILLS_LEN" not in df.columns:
+        df["REQUIRED_SKILLS_LEN"] = get_skills(df).str.len()
+    if "ADDITIONAL_SKILLS_LEN" not in df.columns:
+        df["ADDITIONAL_SKILLS_LEN"] = (
+            df["ADDITIONAL_SKILLS"].map(parse_skills).str.len()
+        )
+    return df
+
+
+def convert_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert payments to floats and dates to datetimes, once per DataFrame.
+
+    Parameters
+    ----------
+    df: DataFrame containing job data, converted in place.
+
+    Returns
+    -------
+    The same DataFrame with converted columns.
+    """
+    for column in PAYMENT_COLUMNS:
+        if not pd.api.types.is_float_dtype(df[column]):
+            df[column] = pd.to_numeric(
+                df[column], errors="coerce"
+            ).astype(float)
+    if "DATE" in df.columns and not pd.api.types.is_datetime64_any_dtype(
+        df["DATE"]
+    ):
+        df["DATE"] = pd.to_datetime(df["DATE"], errors="coerce")
+    return df
+
+
+def fill_payments(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return the payment columns with missing values set to column medians.
+
+    Parameters
+    ----------
+    df: DataFrame containing job data with converted payment columns.
+
+    Returns
+    -------
+    DataFrame with the filled PAYMENT_FROM and PAYMENT_TO columns.
+    """
+    payments = df[PAYMENT_COLUMNS]
+    return payments.fillna(payments.median())
+
+
+def count_skills(skills: pd.Series) -> pd.Series:
+    """
+    Count how often each skill occurs in the given skill lists.
+
+    Parameters
+    ----------
+    skills: Series with a list of skills for each job offer.
+
+    Returns
+    -------
+    Skill counts sorted from the most common skill.
+    """
+    counts = Counter(chain.from_iterable(skills.values))
+    return pd.Series(counts, dtype="int").sort_values(
+        ascending=False, kind="stable"
+    )
+
 
 def analyze_data(df: pd.DataFrame) -> Tuple[LinearRegression, LinearRegression]:
     """
@@ -20,19 +146,12 @@ def analyze_data(df: pd.DataFrame) -> Tuple[LinearRegression, LinearRegression]:
     -------
     Fitted linear regression models for payment from and to.
     """
-    df["REQUIRED_SKILLS_LEN"] = df["REQUIRED_SKILLS"].apply(
-        lambda x: len(eval(x)) if isinstance(x, str) else 0
-    )
-    df["ADDITIONAL_SKILLS_LEN"] = df["ADDITIONAL_SKILLS"].apply(
-        lambda x: len(eval(x)) if isinstance(x, str) and x != "None" else 0
-    )
+    convert_columns(df)
+    attach_skill_lens(df)
     X = df[["REQUIRED_SKILLS_LEN", "ADDITIONAL_SKILLS_LEN"]].fillna(0)
-    y_from = df["PAYMENT_FROM"].astype(float).fillna(
-        df["PAYMENT_FROM"].astype(float).median()
-    )
-    y_to = df["PAYMENT_TO"].astype(float).fillna(
-        df["PAYMENT_TO"].astype(float).median()
-    )
+    payments = fill_payments(df)
+    y_from = payments["PAYMENT_FROM"]
+    y_to = payments["PAYMENT_TO"]
 
     model_from = LinearRegression()
     model_to = LinearRegression()
@@ -54,6 +173,10 @@ def visualize_data(df: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
     -------
     Most common skills and high salary skills.
     """
+    if df.empty:
+        return pd.Series(dtype="int"), pd.Series(dtype="int")
+    convert_columns(df)
+    get_skills(df)  # Parse once, all the plots below reuse it
     most_common_skills, high_salary_skills = analyze_most_desirable_skills(df)
     plot_required_skills_pie_chart(df)
     plot_salary_ranges(df)
@@ -79,12 +202,10 @@ def plot_required_skills_pie_chart(
     -------
     None
     """
-    skills = df["REQUIRED_SKILLS"].apply(
-        lambda x: eval(x) if isinstance(x, str) else []
-    )
+    skills = get_skills(df)
     if skills.apply(len).sum() == 0:
         return  # Skip plotting if there are no skills to plot
-    skills_counts = pd.Series(np.concatenate(skills.values)).value_counts()
+    skills_counts = count_skills(skills)
     skills_counts.head(20).plot(kind="pie", autopct="%1.1f%%", ax=ax)
     if ax:
         ax.set_title(f"Required Skills Distribution - {job_type}")
@@ -107,8 +228,10 @@ def plot_salary_ranges(df: pd.DataFrame) -> None:
     -------
     None
     """
+    if df[PAYMENT_COLUMNS].isna().all(axis=None):
+        return  # Skip plotting if there are no salaries to plot
     # plt.figure(figsize=(6, 4))
-    df[["PAYMENT_FROM", "PAYMENT_TO"]].astype(float).plot(kind="box")
+    df[PAYMENT_COLUMNS].plot(kind="box")
     plt.title("Salary Ranges")
     plt.ylabel("Salary (PLN)")
     plt.show()
@@ -128,25 +251,43 @@ def analyze_most_desirable_skills(
     -------
     Most common skills and high salary skills.
     """
-    skills = df["REQUIRED_SKILLS"].apply(
-        lambda x: eval(x) if isinstance(x, str) else []
-    )
+    skills = get_skills(df)
     if skills.apply(len).sum() == 0:
         return pd.Series(dtype="int"), pd.Series(dtype="int")
-    skills_counts = pd.Series(np.concatenate(skills.values)).value_counts()
-    high_salary_skills = pd.Series(
-        np.concatenate(
-            df[
-                df["PAYMENT_TO"].astype(float) 
-                > df["PAYMENT_TO"].astype(float).quantile(0.75)
-            ]["REQUIRED_SKILLS"]
-            .apply(lambda x: eval(x) if isinstance(x, str) else []).values
-        )
-    ).value_counts()
+    skills_counts = count_skills(skills)
+    payment_to = df["PAYMENT_TO"]
+    high_salary_mask = payment_to > payment_to.quantile(0.75)
+    high_salary_skills = count_skills(skills[high_salary_mask])
 
     return skills_counts.head(20), high_salary_skills.head(20)
 
 
+def plot_job_salary_ranges(
+    df: pd.DataFrame, ax: plt.Axes = None, job_type: str = None
+) -> None:
+    """
+    Plot box plots of salary ranges for a single job type.
+
+    Parameters
+    ----------
+    df: DataFrame containing job data.
+    ax: Matplotlib axes object to draw the plot onto.
+    job_type: Job type for the title.
+
+    Returns
+    -------
+    None
+    """
+    df[PAYMENT_COLUMNS].plot(kind="box", ax=ax)
+    if ax:
+        ax.set_title(f"Salary Ranges for {job_type}")
+        ax.set_ylabel("Salary (PLN)")
+    else:
+        plt.title(f"Salary Ranges for {job_type}")
+        plt.ylabel("Salary (PLN)")
+        plt.show()
+
+
 def plot_job_locations(
     df: pd.DataFrame, ax: plt.Axes = None, job_type: str = None
 ) -> None:
@@ -190,13 +331,10 @@ def plot_salary_trends(df: pd.DataFrame) -> None:
     -------
     None
     """
-    df["DATE"] = pd.to_datetime(df["DATE"])
-    df = df.sort_values("DATE")
+    df = convert_columns(df).sort_values("DATE")
     plt.figure(figsize=(8, 5))
-    plt.plot(
-        df["DATE"], df["PAYMENT_FROM"].astype(float), label="Payment From"
-    )
-    plt.plot(df["DATE"], df["PAYMENT_TO"].astype(float), label="Payment To")
+    plt.plot(df["DATE"], df["PAYMENT_FROM"], label="Payment From")
+    plt.plot(df["DATE"], df["PAYMENT_TO"], label="Payment To")
     plt.title("Salary Trends Over Time")
     plt.xlabel("Date")
     plt.ylabel("Salary (PLN)")
@@ -204,10 +342,15 @@ def plot_salary_trends(df: pd.DataFrame) -> None:
     plt.show()
 
 
-def elbow_method(X: np.ndarray, ax: plt.Axes = None) -> int:
+def elbow_method(
+    X: np.ndarray, ax: plt.Axes = None
+) -> Tuple[int, KMeans]:
     """
     Use the elbow method to determine the optimal number of clusters.
 
+    Each k is fitted once, starting from the centroids found for k - 1
+    plus the point farthest from them.
+
     Parameters
     ----------
     X: Data for clustering.
@@ -215,14 +358,23 @@ def elbow_method(X: np.ndarray, ax: plt.Axes = None) -> int:
 
     Returns
     -------
-    Optimal number of clusters.
+    Optimal number of clusters and the model fitted with that many clusters.
     """
+    X = np.asarray(X, dtype=float)
     distortions = []
+    models = []
+    init = "k-means++"
     K = range(1, min(11, len(X) + 1))
     for k in K:
-        kmeans = KMeans(n_clusters=k, random_state=0)
+        kmeans = KMeans(
+            n_clusters=k, init=init, n_init=1,
+            algorithm="elkan" if k > 1 else "lloyd", random_state=0
+        )
         kmeans.fit(X)
         distortions.append(kmeans.inertia_)
+        models.append(kmeans)
+        farthest = kmeans.transform(X).min(axis=1).argmax()
+        init = np.vstack([kmeans.cluster_centers_, X[farthest]])
 
     angles = []
     for i in range(1, len(K) - 1):
@@ -256,7 +408,7 @@ def elbow_method(X: np.ndarray, ax: plt.Axes = None) -> int:
         plt.title(f"Elbow Method For Optimal k = {optimal_k}")
         plt.show()
 
-    return optimal_k
+    return optimal_k, models[optimal_k - 1]
 
 
 def cluster_job_offers(df: pd.DataFrame) -> None:
@@ -271,16 +423,13 @@ def cluster_job_offers(df: pd.DataFrame) -> None:
     -------
     None
     """
-    df["REQUIRED_SKILLS_LEN"] = df["REQUIRED_SKILLS"].apply(
-        lambda x: len(eval(x)) if isinstance(x, str) else 0
-    )
-    df["ADDITIONAL_SKILLS_LEN"] = df["ADDITIONAL_SKILLS"].apply(
-        lambda x: len(eval(x)) if isinstance(x, str) and x != "None" else 0
-    )
+    attach_skill_lens(df)
 
     df = df.dropna(
         subset=["REQUIRED_SKILLS_LEN", "PAYMENT_FROM", "PAYMENT_TO"]
     )
+    if "JOB_TYPE" not in df.columns or df["JOB_TYPE"].isna().all():
+        return  # Skip plotting if there are no job types to cluster
 
     plot_clusters(df)
 
@@ -297,7 +446,7 @@ def plot_clusters(df: pd.DataFrame) -> None:
     -------
     None
     """
-    job_types = df["JOB_TYPE"].unique()
+    job_types = list(df.groupby("JOB_TYPE", sort=False))
     num_plots = len(job_types)
     num_per_page = 3
     num_pages = (num_plots + num_per_page - 1) // num_per_page
@@ -313,8 +462,7 @@ def plot_clusters(df: pd.DataFrame) -> None:
                 axes[2 * i + 1].axis("off")
                 continue
 
-            job_type = job_types[index]
-            subset = df[df["JOB_TYPE"] == job_type]
+            job_type, subset = job_types[index]
             X = subset[
                 ["REQUIRED_SKILLS_LEN", "PAYMENT_FROM", "PAYMENT_TO"]
             ].dropna()
@@ -324,15 +472,13 @@ def plot_clusters(df: pd.DataFrame) -> None:
                 axes[2 * i + 1].axis("off")
                 continue
 
-            optimal_clusters = elbow_method(X, ax=axes[2 * i])
-
-            kmeans = KMeans(n_clusters=optimal_clusters, random_state=0).fit(X)
+            _, kmeans = elbow_method(X, ax=axes[2 * i])
             subset = subset.copy()  # Avoid SettingWithCopyWarning
             subset.loc[:, "CLUSTER"] = kmeans.labels_
 
             axes[2 * i + 1].scatter(
                 subset["REQUIRED_SKILLS_LEN"],
-                subset["PAYMENT_FROM"].astype(float),
+                subset["PAYMENT_FROM"],
                 c=subset["CLUSTER"],
                 cmap="viridis",
             )
@@ -340,8 +486,9 @@ def plot_clusters(df: pd.DataFrame) -> None:
             axes[2 * i + 1].set_xlabel("Required Skills Length")
             axes[2 * i + 1].set_ylabel("Payment From")
 
-        plt.tight_layout()
+        fig.tight_layout()
         plt.show()
+        plt.close(fig)
 
 
 def analyze_job_types(df: pd.DataFrame) -> None:
@@ -356,67 +503,32 @@ def analyze_job_types(df: pd.DataFrame) -> None:
     -------
     None
     """
-    job_types = df["JOB_TYPE"].unique()
+    convert_columns(df)
+    get_skills(df)  # Parse once, the per job type subsets reuse it
+    job_types = list(df.groupby("JOB_TYPE", sort=False))
     num_plots = len(job_types)
     num_per_page = 4
     num_pages = (num_plots + num_per_page - 1) // num_per_page
 
-    for page in range(num_pages):
-        fig, axes = plt.subplots(nrows=2, ncols=2, figsize=(8, 8))
-        axes = axes.flatten()
-
-        for i in range(num_per_page):
-            index = page * num_per_page + i
-            if index >= num_plots:
-                axes[i].axis("off")
-                continue
+    for plot in (
+        plot_job_salary_ranges, plot_required_skills_pie_chart,
+        plot_job_locations
+    ):
+        for page in range(num_pages):
+            fig, axes = plt.subplots(nrows=2, ncols=2, figsize=(8, 8))
+            axes = axes.flatten()
+            page_job_types = job_types[
+                page * num_per_page:(page + 1) * num_per_page
+            ]
 
-            job_type = job_types[index]
-            subset = df[df["JOB_TYPE"] == job_type]
-            subset[["PAYMENT_FROM", "PAYMENT_TO"]].astype(float).plot(
-                kind="box", ax=axes[i]
-            )
-            axes[i].set_title(f"Salary Ranges for {job_type}")
-            axes[i].set_ylabel("Salary (PLN)")
+            for ax, (job_type, subset) in zip(axes, page_job_types):
+                plot(subset, ax=ax, job_type=job_type)
+            for ax in axes[len(page_job_types):]:
+                ax.axis("off")
 
-        plt.tight_layout()
-        plt.show()
-
-    for page in range(num_pages):
-        fig, axes = plt.subplots(nrows=2, ncols=2, figsize=(8, 8))
-        axes = axes.flatten()
-
-        for i in range(num_per_page):
-            index = page * num_per_page + i
-            if index >= num_plots:
-                axes[i].axis("off")
-                continue
-
-            job_type = job_types[index]
-            subset = df[df["JOB_TYPE"] == job_type]
-            plot_required_skills_pie_chart(
-                subset, ax=axes[i], job_type=job_type
-            )
-
-        plt.tight_layout()
-        plt.show()
-
-    for page in range(num_pages):
-        fig, axes = plt.subplots(nrows=2, ncols=2, figsize=(8, 8))
-        axes = axes.flatten()
-
-        for i in range(num_per_page):
-            index = page * num_per_page + i
-            if index >= num_plots:
-                axes[i].axis("off")
-                continue
-
-            job_type = job_types[index]
-            subset = df[df["JOB_TYPE"] == job_type]
-            plot_job_locations(subset, ax=axes[i], job_type=job_type)
-
-        plt.tight_layout()
-        plt.show()
+            fig.tight_layout()
+            plt.show()
+            plt.close(fig)
 
 
 def analyze_skill_salary_relationship(df: pd.DataFrame) -> None:
@@ -431,23 +543,18 @@ def analyze_skill_salary_relationship(df: pd.DataFrame) -> None:
     -------
     None
     """
-    skills = df["REQUIRED_SKILLS"].apply(
-        lambda x: eval(x) if isinstance(x, str) else []
-    )
-    skill_counts = pd.Series(np.concatenate(skills.values)).value_counts(
-        normalize=True
-    ).head(20)
-
-    skills_repeated = np.concatenate(skills.values)
-    payment_repeated = np.repeat(
-        df["PAYMENT_FROM"].values, [len(s) for s in skills]
-    )
-
-    skill_salary = pd.DataFrame(
-        {"SKILL": skills_repeated, "PAYMENT_FROM": payment_repeated}
+    convert_columns(df)
+    skill_salary = (
+        df[["PAYMENT_FROM"]]
+        .assign(SKILL=get_skills(df))
+        .explode("SKILL")
+        .dropna(subset=["SKILL"])
     )
+    skill_counts = skill_salary["SKILL"].value_counts(normalize=True).head(20)
+    if skill_counts.empty:
+        return  # Skip plotting if there are no skills to plot
     avg_salary_per_skill = (
-        skill_salary.groupby("SKILL")["PAYMENT_FROM"]
+        skill_salary.groupby("SKILL", sort=False)["PAYMENT_FROM"]
         .mean()
         .loc[skill_counts.index]
     )
@@ -474,48 +581,38 @@ def plot_salary_trends(df: pd.DataFrame) -> None:
     -------
     None
     """
-    df["DATE"] = pd.to_datetime(df["DATE"])
-    df = df.sort_values("DATE")
+    if df.empty:
+        return  # Skip plotting if there are no job offers
+    df = convert_columns(df).sort_values("DATE")
 
     # Fill NaN values with the median of the respective columns
-    df["PAYMENT_FROM"] = (
-        df["PAYMENT_FROM"]
-        .astype(float)
-        .fillna(df["PAYMENT_FROM"].astype(float).median())
-    )
-    df["PAYMENT_TO"] = (
-        df["PAYMENT_TO"]
-        .astype(float)
-        .fillna(df["PAYMENT_TO"].astype(float).median())
-    )
+    df[PAYMENT_COLUMNS] = fill_payments(df)
 
     # Adding future dates for approximation
     future_dates = pd.date_range(df["DATE"].max(), periods=10, freq='D')[1:]
     future_df = pd.DataFrame(future_dates, columns=["DATE"])
 
-    model_from = LinearRegression()
-    model_to = LinearRegression()
-
-    X = np.array(df.index).reshape(-1, 1)
-    y_from = df["PAYMENT_FROM"].astype(float)
-    y_to = df["PAYMENT_TO"].astype(float)
-
-    model_from.fit(X, y_from)
-    model_to.fit(X, y_to)
+    # Least squares line through both payment columns at once
+    X = df.index.to_numpy(dtype=float)
+    Y = df[PAYMENT_COLUMNS].to_numpy(dtype=float)
+    X_centered = X - X.mean()
+    variance = X_centered @ X_centered
+    if variance:
+        slope = X_centered @ (Y - Y.mean(axis=0)) / variance
+    else:
+        slope = np.zeros(Y.shape[1])
+    intercept = Y.mean(axis=0) - slope * X.mean()
 
-    future_X = np.array(
-        range(len(df), len(df) + len(future_dates))
-    ).reshape(-1, 1)
-    future_df["PAYMENT_FROM"] = model_from.predict(future_X)
-    future_df["PAYMENT_TO"] = model_to.predict(future_X)
+    future_X = np.arange(len(df), len(df) + len(future_dates))
+    future_df[PAYMENT_COLUMNS] = intercept + slope * future_X[:, None]
 
     plt.figure(figsize=(8, 5))
     plt.plot(
         df["DATE"],
-        df["PAYMENT_FROM"].astype(float),
+        df["PAYMENT_FROM"],
         label="Payment From"
     )
-    plt.plot(df["DATE"], df["PAYMENT_TO"].astype(float), label="Payment To")
+    plt.plot(df["DATE"], df["PAYMENT_TO"], label="Payment To")
     plt.plot(
         future_df["DATE"],
         future_df["PAYMENT_FROM"], 
@@ -1,91 +1,69 @@
 # whole.py
 
 import os
-import requests
-import json
 import datetime
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+from data_processing import (
+    CSV_COLUMNS,
+    OFFER_COLUMNS,
+    SESSION,
+    extract_pages,
+    offer_columns,
+    read_csv_header,
+    read_jobs_csv,
+)
 from visualization import (
     visualize_data,
     analyze_job_types,
     analyze_skill_salary_relationship,
 )
-from main import urls  # Import URLs from main.py
+from urls import URL_ITEMS
+
+# Number of job listings downloaded at the same time
+FETCH_WORKERS = 10
 
+# Columns of the CSV files written by whole.py - the same layout as
+# data_processing.request appends to output_whole.csv, with an empty
+# MATCH_PERCENTAGE as whole.py does not score the skills
+COLUMNS = list(CSV_COLUMNS)
+# Columns telling duplicated job offers apart
+DEDUP_COLUMNS = ["TITLE", "PAYMENT_FROM", "PAYMENT_TO"]
 
-def request(working_dir: str, current_skills: list, url: str) -> pd.DataFrame:
+
+def fetch_offers(url: str, job_type: str) -> Tuple[dict, str]:
     """
-    Request job data from a given URL and save it to a CSV file.
+    Request job data from a given URL.
 
     Parameters
     ----------
-    working_dir: The working directory to save the data.
-    current_skills: List of current skills to include in the request.
     url: URL to request job data from.
+    job_type: Job type to be added to the rows.
 
     Returns
     -------
-    DataFrame containing the job data.
+    Column name -> list of values of the job offers, empty on failure,
+    and the message describing the result. The message is printed by the
+    caller, so the output of the fetching threads does not interleave.
     """
     try:
-        file_path = os.path.join(working_dir, "output_data.csv")
-        if os.path.exists(file_path):
-            os.remove(file_path)
-
-        resp = requests.get(url)
+        resp = SESSION.get(url, timeout=10)
         if resp.status_code == 200:
-            json_string = str(
-                resp.text.split('{"pages":')[1].split('"meta":')[0].rstrip(",")
-                + "}]"
+            offers = extract_pages(resp.content)[0]["data"]
+            columns = offer_columns(
+                offers, datetime.date.today().isoformat(), job_type
             )
-            data_set = json.loads(json_string)
-            data_list = []
-            for data in data_set[0]["data"]:
-                sub_url = "https://justjoin.it/offers/" + data["slug"]
-                required_skills = data.get("requiredSkills", [])
-                additional_skills = data.get("niceToHaveSkills", [])
-                employment_info = (
-                    data["employmentTypes"][0] if data["employmentTypes"] else {}
-                )
-
-                row = {
-                    "TITLE": data.get("title", ""),
-                    "REQUIRED_SKILLS": str(required_skills),
-                    "ADDITIONAL_SKILLS": str(additional_skills),
-                    "WORKPLACE_TYPE": data.get("workplaceType", ""),
-                    "REMOTE_INTERVIEW": data.get("remoteInterview", ""),
-                    "URL": sub_url,
-                    "PAYMENT_FROM": str(employment_info.get("fromPln", "")),
-                    "PAYMENT_TO": str(employment_info.get("toPln", "")),
-                    "LOCATION": data.get("city", "Unknown"),
-                    "COMPANY": data.get("companyName", "Unknown"),
-                    "DATE": datetime.datetime.now().strftime("%Y-%m-%d"),
-                }
-                data_list.append(row)
-                print("Processed:", data["title"])
-            df = pd.DataFrame(data_list)
-            write_header = not os.path.exists(file_path)
-            df.to_csv(file_path, mode="a", index=False, header=write_header)
-
-            whole_file_path = os.path.join(working_dir, "output_whole.csv")
-            df.to_csv(
-                whole_file_path,
-                mode="a",
-                index=False,
-                header=not os.path.exists(whole_file_path),
-            )
-
-            print("Data appended to CSV.")
-            return df
+            return columns, f"Processed {len(offers)} offers for {job_type}"
         else:
-            print(f"Failed to fetch data for {url}: HTTP {resp.status_code}")
-            return pd.DataFrame()
+            return {}, (
+                f"Failed to fetch data for {url}: HTTP {resp.status_code}"
+            )
     except Exception as e:
-        print(f"Error processing request: {e}")
-        return pd.DataFrame()
+        return {}, f"Error processing request: {e}"
 
 
-def fetch_job_data(working_dir: str, current_skills: list) -> list:
+def fetch_job_data(working_dir: str, current_skills: list) -> dict:
     """
     Fetch job data for all job types from URLs.
 
@@ -96,25 +74,83 @@ def fetch_job_data(working_dir: str, current_skills: list) -> list:
 
     Returns
     -------
-    List of dictionaries containing job data.
-    """
-    all_data = []
-    for job_type, url in urls.items():
-        print(f"Fetching data for {job_type} from {url}")
-        data = request(working_dir, current_skills, url)
-        if not data.empty:
-            data["JOB_TYPE"] = job_type
-            all_data.extend(data.to_dict("records"))
+    Column name -> list of values of all fetched job offers.
+    """
+    # The listings only wait on the network, so they are fetched side by
+    # side and the results are written once all of them have arrived
+    all_data = {column: [] for column in OFFER_COLUMNS}
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        job_types, job_urls = zip(*URL_ITEMS)
+        results = executor.map(fetch_offers, job_urls, job_types)
+        # map yields the results in the order of URL_ITEMS, so a job type
+        # is reported once its own listing and all listings before it
+        # have arrived - a slow listing holds back the reports after it
+        for (job_type, url), (columns, message) in zip(URL_ITEMS, results):
+            print(f"Fetching data for {job_type} from {url}")
+            print(message)
+            for column, values in columns.items():
+                all_data[column].extend(values)
+
+    file_path = os.path.join(working_dir, "output_data.csv")
+    if os.path.exists(file_path):
+        os.remove(file_path)
+    if all_data["TITLE"]:
+        pd.DataFrame(all_data).reindex(columns=COLUMNS).to_csv(
+            file_path, index=False
+        )
+        print("Data saved to CSV.")
     return all_data
 
 
-def save_to_csv(data: list, file_path: str) -> None:
+def dedup_keys(df: pd.DataFrame) -> list:
+    """
+    Return the key telling duplicated job offers apart for every row.
+
+    Parameters
+    ----------
+    df: DataFrame containing job data.
+
+    Returns
+    -------
+    List of (TITLE, PAYMENT_FROM, PAYMENT_TO) tuples, missing payments as
+    None so that offers without a salary compare equal.
+    """
+    payments = df[["PAYMENT_FROM", "PAYMENT_TO"]].apply(
+        pd.to_numeric, errors="coerce"
+    )
+    payments = payments.astype(object).where(payments.notna(), None)
+    return list(
+        zip(df["TITLE"], payments["PAYMENT_FROM"], payments["PAYMENT_TO"])
+    )
+
+
+def first_occurrences(keys: list, seen: set) -> list:
+    """
+    Mark the keys that are seen for the first time and remember them.
+
+    Parameters
+    ----------
+    keys: Keys of the rows, in row order.
+    seen: Keys met so far, updated in place.
+
+    Returns
+    -------
+    List of booleans, True for the rows to keep.
+    """
+    mask = []
+    for key in keys:
+        mask.append(key not in seen)
+        seen.add(key)
+    return mask
+
+
+def save_to_csv(data: dict, file_path: str) -> None:
     """
-    Save job data to a CSV file.
+    Save job data to a CSV file, skipping offers it already holds.
 
     Parameters
     ----------
-    data: List of dictionaries containing job data.
+    data: Column name -> list of values of the job offers.
     file_path: Path to the CSV file to save the data.
 
     Returns
@@ -124,33 +160,28 @@ def save_to_csv(data: list, file_path: str) -> None:
     df = pd.DataFrame(data)
     if not df.empty:
         df.columns = [col.strip() for col in df.columns]
+        existing_df = None
+        seen = set()
         if os.path.exists(file_path):
-            existing_df = pd.read_csv(file_path)
-            combined_df = pd.concat([existing_df, df]).drop_duplicates(
-                subset=["TITLE", "PAYMENT_FROM", "PAYMENT_TO"]
-            )
+            if read_csv_header(file_path) == COLUMNS:
+                # Only the new offers are appended to an up to date file,
+                # so the old rows are needed just for their keys
+                keys_df = read_jobs_csv(file_path, columns=DEDUP_COLUMNS)
+                seen.update(dedup_keys(keys_df))
+                df = df[first_occurrences(dedup_keys(df), seen)]
+                df.reindex(columns=COLUMNS).to_csv(
+                    file_path, mode="a", index=False, header=False
+                )
+                return
+            existing_df = read_jobs_csv(file_path)
+            existing_unique = first_occurrences(dedup_keys(existing_df), seen)
+        df = df[first_occurrences(dedup_keys(df), seen)]
+
+        if existing_df is not None:
+            combined_df = pd.concat([existing_df[existing_unique], df])
         else:
-            combined_df = df.drop_duplicates(
-                subset=["TITLE", "PAYMENT_FROM", "PAYMENT_TO"]
-            )
-        required_columns = [
-            "TITLE",
-            "REQUIRED_SKILLS",
-            "ADDITIONAL_SKILLS",
-            "WORKPLACE_TYPE",
-            "REMOTE_INTERVIEW",
-            "URL",
-            "PAYMENT_FROM",
-            "PAYMENT_TO",
-            "LOCATION",
-            "COMPANY",
-            "DATE",
-            "JOB_TYPE",
-        ]
-        for col in required_columns:
-            if col not in combined_df.columns:
-                combined_df[col] = ""
-        combined_df = combined_df[required_columns]
+            combined_df = df
+        combined_df = combined_df.reindex(columns=COLUMNS, fill_value="")
         combined_df.to_csv(file_path, index=False)
     else:
         print("No data to save.")
@@ -169,7 +200,7 @@ def analyze_and_visualize(file_path: str) -> None:
     None
     """
     if os.path.exists(file_path):
-        df = pd.read_csv(file_path)
+        df = read_jobs_csv(file_path)
         visualize_data(df)
         analyze_job_types(df)
         analyze_skill_salary_relationship(df)
@@ -177,22 +208,35 @@ def analyze_and_visualize(file_path: str) -> None:
         print(f"No file found at {file_path} to analyze and visualize.")
 
 
-def main() -> None:
+def collect_job_data() -> str:
     """
-    Main function to fetch, save, analyze, and visualize job data.
+    Fetch job data for all job types and save it to output_whole.csv.
 
     This function takes no parameters.
 
     Returns
     -------
-    None
+    Path to the CSV file with the saved job data.
     """
     working_dir = os.getcwd()
     current_skills = []  # Load current skills from the file or user input if necessary
     file_path = os.path.join(working_dir, "output_whole.csv")
     all_data = fetch_job_data(working_dir, current_skills)
     save_to_csv(all_data, file_path)
-    analyze_and_visualize(file_path)
+    return file_path
+
+
+def main() -> None:
+    """
+    Main function to fetch, save, analyze, and visualize job data.
+
+    This function takes no parameters.
+
+    Returns
+    -------
+    None
+    """
+    analyze_and_visualize(collect_job_data())
 
 
 if __name__ == "__main__":